@@ -1,70 +1,162 @@
+import io
+from contextlib import nullcontext
+from datetime import date
+from types import MappingProxyType
+
 import streamlit as st
+import numpy as np
 import pandas as pd
+import matplotlib.pyplot as plt
 import masco_2025 as masco
 from streamlit.components.v1 import html
-from scipy.stats import norm
+
+# Fallback tickers used when stocks.py does not define `stock_tickers`
+_FALLBACK_TICKERS = MappingProxyType({
+    "PCG": "PCG",
+    "WABTEC": "WAB",
+    "ETR": "ETR",
+    "DOV": "DOV",
+    "General_Dynamics": "GD",
+    "PAR": "PAR",
+    "OKE": "OKE",
+    "LVS": "LVS",
+    "MCO": "MCO",
+    "LMT": "LMT",
+    "EIX": "EIX",
+    "SYK": "SYK",
+    "HOLX": "HOLX",
+    "MHK": "MHK",
+    "NOC": "NOC",
+    "IFF": "IFF",
+    "AZO": "AZO",
+    "Southern_Company": "SO",
+    "TTWO": "TTWO",
+    "Kimberly_Clark": "KMB",
+    "CHD": "CHD",
+    "EXR": "EXR",
+    "CRL": "CRL",
+    "Texas_Instruments": "TXN",
+})
 
 # Import stock tickers - handle import errors gracefully
 try:
     import stocks
-    if hasattr(stocks, 'stock_tickers'):
-        stock_tickers_dict = stocks.stock_tickers
-    else:
-        # Fallback: define directly if import fails
-        stock_tickers_dict = {
-            "PCG": "PCG",
-            "WABTEC": "WAB",
-            "ETR": "ETR",
-            "DOV": "DOV",
-            "General_Dynamics": "GD",
-            "PAR": "PAR",
-            "OKE": "OKE",
-            "LVS": "LVS",
-            "MCO": "MCO",
-            "LMT": "LMT",
-            "EIX": "EIX",
-            "SYK": "SYK",
-            "HOLX": "HOLX",
-            "MHK": "MHK",
-            "NOC": "NOC",
-            "IFF": "IFF",
-            "AZO": "AZO",
-            "Southern_Company": "SO",
-            "TTWO": "TTWO",
-            "Kimberly_Clark": "KMB",
-            "CHD": "CHD",
-            "EXR": "EXR",
-            "CRL": "CRL",
-            "Texas_Instruments": "TXN",
-        }
-except (ImportError, AttributeError):
-    # Fallback: define directly if import fails
-    stock_tickers_dict = {
-        "PCG": "PCG",
-        "WABTEC": "WAB",
-        "ETR": "ETR",
-        "DOV": "DOV",
-        "General_Dynamics": "GD",
-        "PAR": "PAR",
-        "OKE": "OKE",
-        "LVS": "LVS",
-        "MCO": "MCO",
-        "LMT": "LMT",
-        "EIX": "EIX",
-        "SYK": "SYK",
-        "HOLX": "HOLX",
-        "MHK": "MHK",
-        "NOC": "NOC",
-        "IFF": "IFF",
-        "AZO": "AZO",
-        "Southern_Company": "SO",
-        "TTWO": "TTWO",
-        "Kimberly_Clark": "KMB",
-        "CHD": "CHD",
-        "EXR": "EXR",
-        "CRL": "CRL",
-        "Texas_Instruments": "TXN",
-    }
+    stock_tickers_dict = getattr(stocks, 'stock_tickers', _FALLBACK_TICKERS)
+except ImportError:
+    stock_tickers_dict = _FALLBACK_TICKERS
+
+# Default analysis period shown in the sidebar
+_DEFAULT_START = date(2005, 1, 1)
+_DEFAULT_END = date(2025, 1, 30)
+
+# Characters replaced/dropped when building download filenames from stock names
+_FILENAME_TABLE = str.maketrans({' ': '_', '(': None, ')': None, '/': '_'})
+
+# Minified print stylesheet and print-button styles, served together with the
+# print button in a single components.html() call at the bottom of the page
+_PRINT_CSS_MIN = (
+    '@media print{@page{size:letter;margin:0.75in}'
+    'header[data-testid="stHeader"],[data-testid="stSidebar"],[data-testid="stToolbar"],.stDeployButton,#print-button-container{display:none !important;visibility:hidden !important}'
+    '.main .block-container{max-width:100% !important;padding:0 !important}'
+    'body,html,.stApp{visibility:visible !important;background:white !important}'
+    '.print-page-break-1{page-break-after:always !important;display:block !important;height:0 !important;margin:0 !important;padding:0 !important}'
+    '.element-container{page-break-inside:avoid;margin-bottom:0.3em !important}'
+    '.stargazer-table,.stargazer-table *{color:#000000 !important;background-color:#ffffff !important;visibility:visible !important}'
+    '.stargazer-table table{width:100% !important;font-size:9pt !important;border-collapse:collapse !important}'
+    '[data-testid="stImage"],[data-testid="stPyplot"],.stImage,img,canvas{page-break-inside:avoid !important;max-width:100% !important;height:auto !important;visibility:visible !important;display:block !important}'
+    'h1,h2,h3,h4,p,div,span,td,th{color:#000000 !important;visibility:visible !important}'
+    '.stMarkdown{margin-bottom:0.3em !important}'
+    'h1,h2,h3{page-break-after:avoid;margin-top:0.5em !important;margin-bottom:0.3em !important}'
+    '[data-testid="column"]{padding:0.2em !important}'
+    '[data-testid="stExpander"]{display:none !important}'
+    '[data-testid="stMetric"]{visibility:visible !important}'
+    '}'
+    '#print-button-container{text-align:center;margin:30px 0;padding:20px;background-color:#f0f2f6;border-radius:10px}'
+    '#print-button{background-color:#1f77b4;color:white;border:none;padding:12px 30px;font-size:16px;font-weight:500;border-radius:5px;cursor:pointer;box-shadow:0 2px 4px rgba(0,0,0,0.2);transition:all 0.3s}'
+    '#print-button:hover{background-color:#1565a0;transform:translateY(-1px);box-shadow:0 4px 6px rgba(0,0,0,0.3)}'
+    '#print-button:active{background-color:#0d4d7a;transform:translateY(0)}'
+)
+
+
+@st.cache_data(show_spinner=False)
+def _stock_options():
+    """Return the sorted name -> ticker options, their names and the default index."""
+    # Add MAS as default option
+    merged = {**stock_tickers_dict, "MASCO (MAS)": "MAS"}
+    options = dict(sorted(merged.items()))
+    names = list(options)
+    return options, names, names.index("MASCO (MAS)")
+
+
+# Cached wrappers around the analysis pipeline. Streamlit reruns this script on
+# every widget interaction, so everything is keyed on (ticker, start, end) to
+# turn unchanged reruns into cache lookups.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_load(stock_ticker, start, end):
+    """Download and compute monthly returns for the selected stock."""
+    return masco.load_data(stock_ticker=stock_ticker, start=start, end=end)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_regressions(stock_ticker, stock_name, start, end):
+    """Fit the regression models and build the display table."""
+    returns = _cached_load(stock_ticker, start, end)
+    regressions = masco.run_regressions(returns, stock_ticker=stock_ticker)
+    regression_df = masco.create_regression_table_dataframe(regressions, stock_ticker=stock_ticker, stock_name=stock_name)
+    return regressions, regression_df
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_figure_pngs(stock_ticker, start, end):
+    """Rasterize both figures to PNG once; reruns only resend the bytes.
+    
+    The figures are built and closed within the call, so no live Figure is
+    shared between sessions' script threads.
+    """
+    returns = _cached_load(stock_ticker, start, end)
+    pngs = []
+    for plot in (masco.plot_normal_distribution, masco.plot_cdf):
+        fig = plot(returns, stock_ticker=stock_ticker)
+        try:
+            # Same savefig settings st.pyplot uses
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+            pngs.append(buffer.getvalue())
+        finally:
+            plt.close(fig)
+    return tuple(pngs)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_pdf(stock_ticker, stock_name, start, end):
+    """Render the PDF report and return its bytes (figures are built and closed per call)."""
+    return masco.build_report(stock_ticker, start, end, stock_name=stock_name)
+
+
+# Fitted results are keyed by the statistics the summary reads from them
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={list: lambda regs: tuple((r.rsquared, r.rsquared_adj, r.fvalue, r.nobs) for r in regs)}
+)
+def _build_reg_summary(regressions):
+    """Summarize fit statistics for each regression model."""
+    n_regs = len(regressions)
+    return pd.DataFrame({
+        'Model': [f'({i})' for i in range(1, n_regs + 1)],
+        'R-squared': np.fromiter((reg.rsquared for reg in regressions), dtype=np.float64, count=n_regs),
+        'Adj R-squared': np.fromiter((reg.rsquared_adj for reg in regressions), dtype=np.float64, count=n_regs),
+        'F-statistic': np.fromiter((reg.fvalue for reg in regressions), dtype=np.float64, count=n_regs),
+        'Observations': np.fromiter((reg.nobs for reg in regressions), dtype=np.int64, count=n_regs),
+    }).round(4)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _csv_bytes(df, index=True):
+    """Encode a DataFrame as UTF-8 CSV bytes for download."""
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=index)
+    return buffer.getvalue()
+
 
 # Page configuration (will be updated after stock selection)
 st.set_page_config(
@@ -73,77 +165,30 @@ st.set_page_config(
     layout="wide"
 )
 
-# Inject print CSS early
-print_css_early = """
-<style>
-    @media print {
-        @page {
-            size: letter;
-            margin: 0.75in;
-        }
-        
-        /* Hide UI elements */
-        header[data-testid="stHeader"],
-        [data-testid="stSidebar"],
-        [data-testid="stToolbar"],
-        .stDeployButton,
-        #print-button-container {
-            display: none !important;
-        }
-        
-        /* Ensure all content is visible */
-        body, html {
-            background: white !important;
-        }
-        
-        .main .block-container {
-            max-width: 100% !important;
-            padding: 0 !important;
-        }
-        
-        .print-page-break-1 {
-            page-break-after: always !important;
-        }
-        
-        .element-container {
-            page-break-inside: avoid;
-        }
-        
-        [data-testid="stImage"],
-        [data-testid="stPyplot"],
-        img {
-            page-break-inside: avoid !important;
-            max-width: 100% !important;
-        }
-        
-        [data-testid="stExpander"] {
-            display: none !important;
-        }
-    }
-</style>
-"""
-html(print_css_early, height=0)
-
 # Sidebar for stock and date range selection
 st.sidebar.header("Settings")
 
 # Stock selection
-stock_options = {name: ticker for name, ticker in stock_tickers_dict.items()}
-# Add MAS as default option
-stock_options["MASCO (MAS)"] = "MAS"
-stock_options = dict(sorted(stock_options.items()))
+stock_options, stock_names, default_stock_index = _stock_options()
 
 selected_stock_name = st.sidebar.selectbox(
     "Select Stock",
-    options=list(stock_options.keys()),
-    index=list(stock_options.keys()).index("MASCO (MAS)") if "MASCO (MAS)" in stock_options else 0,
+    options=stock_names,
+    index=default_stock_index,
     help="Choose a stock to analyze"
 )
 selected_stock_ticker = stock_options[selected_stock_name]
+safe_stock_name = selected_stock_name.translate(_FILENAME_TABLE)
 
 # Date range selection
-start_date = st.sidebar.date_input("Start Date", value=pd.to_datetime("2005-01-01"))
-end_date = st.sidebar.date_input("End Date", value=pd.to_datetime("2025-01-30"))
+start_date = st.sidebar.date_input("Start Date", value=_DEFAULT_START)
+end_date = st.sidebar.date_input("End Date", value=_DEFAULT_END)
+
+# Date strings used for data loading/caching (ISO) and download filenames
+start_iso = start_date.strftime("%Y-%m-%d")
+end_iso = end_date.strftime("%Y-%m-%d")
+start_fn = start_date.strftime("%Y%m%d")
+end_fn = end_date.strftime("%Y%m%d")
 
 # Title and header
 st.title(f"📈 {selected_stock_name} Stock Returns Analysis")
@@ -185,13 +230,15 @@ with st.expander("🎓 Why This Analysis Matters (Click to Learn More!)", expand
     This analysis helps answer: "If the market goes up 10%, how much will my stock go up?" That's super useful for anyone investing money! 💰
     """)
 
+# Spinners are only shown the first time a selection is loaded in this
+# session; repeat selections are cache hits and skip the spinner DOM updates
+load_key = (selected_stock_ticker, start_iso, end_iso)
+seen_loads = st.session_state.setdefault("seen_loads", set())
+first_load = load_key not in seen_loads
+
 # Load data with progress indicator
-with st.spinner(f"Loading {selected_stock_ticker} stock data..."):
-    returns = masco.load_data(
-        stock_ticker=selected_stock_ticker,
-        start=start_date.strftime("%Y-%m-%d"),
-        end=end_date.strftime("%Y-%m-%d")
-    )
+with st.spinner(f"Loading {selected_stock_ticker} stock data...") if first_load else nullcontext():
+    returns = _cached_load(selected_stock_ticker, start_iso, end_iso)
 
 # Display data info
 col1, col2, col3 = st.columns(3)
@@ -205,13 +252,21 @@ with col3:
 st.divider()
 
 # Run regressions once for all visualizations
-with st.spinner("Running regressions..."):
-    regressions = masco.run_regressions(returns, stock_ticker=selected_stock_ticker)
-    regression_df = masco.create_regression_table_dataframe(regressions, stock_ticker=selected_stock_ticker, stock_name=selected_stock_name)
+with st.spinner("Running regressions...") if first_load else nullcontext():
+    regressions, regression_df = _cached_regressions(
+        selected_stock_ticker, selected_stock_name, start_iso, end_iso
+    )
+seen_loads.add(load_key)
 
-# Prepare data for graphs
-stock_returns = returns[selected_stock_ticker].dropna()
-sp = returns["SP500"].dropna()
+# Prepare data for graphs: take each column as a float64 array once and
+# compute every reduction used below from it
+stock_arr = returns[selected_stock_ticker].to_numpy(dtype=np.float64, copy=False)
+stock_arr = stock_arr[~np.isnan(stock_arr)]
+sp_arr = returns["SP500"].to_numpy(dtype=np.float64, copy=False)
+sp_arr = sp_arr[~np.isnan(sp_arr)]
+
+stock_mean, stock_min, stock_max = stock_arr.mean(), stock_arr.min(), stock_arr.max()
+sp_mean, sp_min, sp_max = sp_arr.mean(), sp_arr.min(), sp_arr.max()
 
 # ===== SECTION 1: REGRESSION TABLE =====
 st.header(f"📊 {selected_stock_name} Monthly Return Regressions")
@@ -270,6 +325,7 @@ with st.expander("📘 How to Perform This Analysis in Excel"):
     **Step 1: Prepare Your Data**
     - Download monthly stock price data from Yahoo Finance or other sources
     - Calculate monthly returns using the formula: `=LN(Price_t / Price_{t-1})`
+    - For the 30-Year Treasury (a yield), use the change instead: `=Yield_t - Yield_{t-1}`
     - Organize your data in columns: Date, Stock Returns, S&P 500 Returns, Value-Weighted Returns, 30-Year Treasury Returns
     
     **Step 2: Install Data Analysis ToolPak**
@@ -320,14 +376,16 @@ st.divider()
 st.header("📉 Normal Distribution Fit")
 st.markdown(f"Histogram of {selected_stock_ticker} monthly returns with fitted normal distribution curve.")
 
+normal_png, cdf_png = _cached_figure_pngs(selected_stock_ticker, start_iso, end_iso)
+
 col1, col2 = st.columns([2, 1])
 with col1:
-    fig_normal = masco.plot_normal_distribution(returns, stock_ticker=selected_stock_ticker)
-    st.pyplot(fig_normal)
+    st.image(normal_png, width="stretch")
 
 with col2:
     st.subheader("Distribution Parameters")
-    mu, sigma = norm.fit(stock_returns)
+    # Normal MLE is closed-form: sample mean and population std (ddof=0)
+    mu, sigma = stock_mean, stock_arr.std()
     st.metric("Mean (μ)", f"{mu:.4f}")
     st.metric("Standard Deviation (σ)", f"{sigma:.4f}")
     st.metric("Variance (σ²)", f"{sigma**2:.4f}")
@@ -376,8 +434,7 @@ st.markdown(f"Comparison of cumulative distribution of monthly returns: {selecte
 
 col1, col2 = st.columns([2, 1])
 with col1:
-    fig_cdf = masco.plot_cdf(returns, stock_ticker=selected_stock_ticker)
-    st.pyplot(fig_cdf)
+    st.image(cdf_png, width="stretch")
 
 with col2:
     st.subheader("Comparison Statistics")
@@ -385,17 +442,17 @@ with col2:
     col_stat1, col_stat2 = st.columns(2)
     with col_stat1:
         st.markdown(f"**{selected_stock_ticker}**")
-        st.write(f"Mean: {stock_returns.mean():.4f}")
-        st.write(f"Std Dev: {stock_returns.std():.4f}")
-        st.write(f"Min: {stock_returns.min():.4f}")
-        st.write(f"Max: {stock_returns.max():.4f}")
+        st.write(f"Mean: {stock_mean:.4f}")
+        st.write(f"Std Dev: {stock_arr.std(ddof=1):.4f}")
+        st.write(f"Min: {stock_min:.4f}")
+        st.write(f"Max: {stock_max:.4f}")
     
     with col_stat2:
         st.markdown("**S&P 500**")
-        st.write(f"Mean: {sp.mean():.4f}")
-        st.write(f"Std Dev: {sp.std():.4f}")
-        st.write(f"Min: {sp.min():.4f}")
-        st.write(f"Max: {sp.max():.4f}")
+        st.write(f"Mean: {sp_mean:.4f}")
+        st.write(f"Std Dev: {sp_arr.std(ddof=1):.4f}")
+        st.write(f"Min: {sp_min:.4f}")
+        st.write(f"Max: {sp_max:.4f}")
 
 # Excel tutorial for CDF
 with st.expander("📘 How to Create CDF Graph in Excel"):
@@ -454,41 +511,46 @@ st.markdown("**Data Source:** Yahoo Finance | **Analysis Period:** 2005-2025")
 st.divider()
 st.subheader("📥 Download Results")
 
-# Generate PDF report
-with st.spinner("Preparing PDF download..."):
-    pdf_buffer = masco.generate_pdf_report(
-        returns, regressions, fig_normal, fig_cdf,
-        start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'),
-        stock_ticker=selected_stock_ticker, stock_name=selected_stock_name
-    )
-    pdf_bytes = pdf_buffer.getvalue()
-
 # Main PDF download button (prominent)
 col_main, col_side = st.columns([2, 1])
 
 with col_main:
     # Create filename with stock ticker
-    safe_stock_name = selected_stock_name.replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")
-    pdf_filename = f"{selected_stock_ticker}_{safe_stock_name}_report_{start_date.strftime('%Y%m%d')}_to_{end_date.strftime('%Y%m%d')}.pdf"
-    
-    st.download_button(
-        label="📄 Download Full Report as PDF",
-        data=pdf_bytes,
-        file_name=pdf_filename,
-        mime="application/pdf",
-        help="Download complete report with Stargazer table, normal distribution graph, and CDF graph as PDF",
-        use_container_width=True,
-        type="primary"
-    )
+    pdf_filename = f"{selected_stock_ticker}_{safe_stock_name}_report_{start_fn}_to_{end_fn}.pdf"
+    
+    # The PDF is only generated on request; the bytes are kept in session
+    # state for the current selection so later reruns skip the rebuild
+    pdf_key = (selected_stock_ticker, selected_stock_name, start_iso, end_iso)
+    if st.session_state.get("pdf_key") != pdf_key:
+        if st.button(
+            "📄 Build PDF Report",
+            help="Generate the full report as PDF (takes a few seconds)",
+            use_container_width=True
+        ):
+            with st.spinner("Preparing PDF download..."):
+                st.session_state["pdf_bytes"] = _cached_pdf(
+                    selected_stock_ticker, selected_stock_name, start_iso, end_iso
+                )
+                st.session_state["pdf_key"] = pdf_key
+    
+    if st.session_state.get("pdf_key") == pdf_key:
+        st.download_button(
+            label="📄 Download Full Report as PDF",
+            data=st.session_state["pdf_bytes"],
+            file_name=pdf_filename,
+            mime="application/pdf",
+            help="Download complete report with Stargazer table, normal distribution graph, and CDF graph as PDF",
+            use_container_width=True,
+            type="primary"
+        )
     st.markdown("**Includes:** Stargazer regression table, Normal distribution graph, and CDF graph")
 
 with col_side:
     # Additional download options
     with st.expander("Other Downloads"):
         # Download returns data as CSV
-        csv_returns = returns.to_csv()
-        safe_stock_name = selected_stock_name.replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")
-        csv_filename = f"{selected_stock_ticker}_{safe_stock_name}_returns_{start_date.strftime('%Y%m%d')}_to_{end_date.strftime('%Y%m%d')}.csv"
+        csv_returns = _csv_bytes(returns)
+        csv_filename = f"{selected_stock_ticker}_{safe_stock_name}_returns_{start_fn}_to_{end_fn}.csv"
         st.download_button(
             label="📊 Returns Data (CSV)",
             data=csv_returns,
@@ -498,18 +560,9 @@ with col_side:
         )
         
         # Download regression summary as CSV
-        reg_summary = []
-        for i, reg in enumerate(regressions, 1):
-            reg_summary.append({
-                'Model': f'({i})',
-                'R-squared': f"{reg.rsquared:.4f}",
-                'Adj R-squared': f"{reg.rsquared_adj:.4f}",
-                'F-statistic': f"{reg.fvalue:.4f}",
-                'Observations': reg.nobs
-            })
-        reg_df = pd.DataFrame(reg_summary)
-        csv_reg = reg_df.to_csv(index=False)
-        reg_filename = f"{selected_stock_ticker}_{safe_stock_name}_regression_summary_{start_date.strftime('%Y%m%d')}_to_{end_date.strftime('%Y%m%d')}.csv"
+        reg_df = _build_reg_summary(regressions)
+        csv_reg = _csv_bytes(reg_df, index=False)
+        reg_filename = f"{selected_stock_ticker}_{safe_stock_name}_regression_summary_{start_fn}_to_{end_fn}.csv"
         st.download_button(
             label="📈 Regression Summary (CSV)",
             data=csv_reg,
@@ -518,147 +571,8 @@ with col_side:
             use_container_width=True
         )
 
-# Print button and print styles
-print_css_js = """
-<style>
-    @media print {
-        /* Page setup for 2 pages */
-        @page {
-            size: letter;
-            margin: 0.75in;
-        }
-        
-        /* Hide sidebar and UI elements */
-        header[data-testid="stHeader"],
-        [data-testid="stSidebar"],
-        [data-testid="stToolbar"],
-        .stDeployButton,
-        #print-button-container {
-            display: none !important;
-            visibility: hidden !important;
-        }
-        
-        /* Ensure main content is visible */
-        .main .block-container {
-            max-width: 100% !important;
-            padding: 0 !important;
-        }
-        
-        /* Make sure all content is visible */
-        body, html, .stApp {
-            visibility: visible !important;
-            background: white !important;
-        }
-        
-        /* Force page break after regression section */
-        .print-page-break-1 {
-            page-break-after: always !important;
-            display: block !important;
-            height: 0 !important;
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        
-        /* Ensure content fits on pages */
-        .element-container {
-            page-break-inside: avoid;
-            margin-bottom: 0.3em !important;
-        }
-        
-        /* Table styling for print - ensure visibility */
-        .stargazer-table,
-        .stargazer-table * {
-            color: #000000 !important;
-            background-color: #ffffff !important;
-            visibility: visible !important;
-        }
-        
-        .stargazer-table table {
-            width: 100% !important;
-            font-size: 9pt !important;
-            border-collapse: collapse !important;
-        }
-        
-        /* Graph containers - ensure visibility */
-        [data-testid="stImage"],
-        [data-testid="stPyplot"],
-        .stImage,
-        img,
-        canvas {
-            page-break-inside: avoid !important;
-            max-width: 100% !important;
-            height: auto !important;
-            visibility: visible !important;
-            display: block !important;
-        }
-        
-        /* Text content visibility */
-        h1, h2, h3, h4, p, div, span, td, th {
-            color: #000000 !important;
-            visibility: visible !important;
-        }
-        
-        /* Optimize spacing */
-        .stMarkdown {
-            margin-bottom: 0.3em !important;
-        }
-        
-        h1, h2, h3 {
-            page-break-after: avoid;
-            margin-top: 0.5em !important;
-            margin-bottom: 0.3em !important;
-        }
-        
-        /* Reduce padding in columns */
-        [data-testid="column"] {
-            padding: 0.2em !important;
-        }
-        
-        /* Hide expanders in print */
-        [data-testid="stExpander"] {
-            display: none !important;
-        }
-        
-        /* Ensure metrics are visible */
-        [data-testid="stMetric"] {
-            visibility: visible !important;
-        }
-    }
-    
-    /* Print button styling */
-    #print-button-container {
-        text-align: center;
-        margin: 30px 0;
-        padding: 20px;
-        background-color: #f0f2f6;
-        border-radius: 10px;
-    }
-    
-    #print-button {
-        background-color: #1f77b4;
-        color: white;
-        border: none;
-        padding: 12px 30px;
-        font-size: 16px;
-        font-weight: 500;
-        border-radius: 5px;
-        cursor: pointer;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        transition: all 0.3s;
-    }
-    
-    #print-button:hover {
-        background-color: #1565a0;
-        transform: translateY(-1px);
-        box-shadow: 0 4px 6px rgba(0,0,0,0.3);
-    }
-    
-    #print-button:active {
-        background-color: #0d4d7a;
-        transform: translateY(0);
-    }
-</style>
-
+# Print button (print styles come from _PRINT_CSS_MIN)
+print_button_html = """
 <div id="print-button-container">
     <button id="print-button" onclick="window.print()">
         📄 Download as PDF / Print
@@ -684,5 +598,5 @@ print_css_js = """
 </script>
 """
 
-html(print_css_js, height=100)
+html(f"<style>{_PRINT_CSS_MIN}</style>" + print_button_html, height=100)
 
@@ -8,9 +8,10 @@ including regression analysis, normal distribution fitting, and CDF plotting.
 import yfinance as yf
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
-from stargazer.stargazer import Stargazer
-from scipy.stats import norm
+from scipy import linalg
+from scipy.stats import t as student_t
+import matplotlib
+matplotlib.use('Agg')  # non-interactive backend; figures are only rendered to PNG
 import matplotlib.pyplot as plt
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -19,147 +20,398 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 import io
-from datetime import datetime
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER
-import io
-from datetime import datetime
+import os
+import math
+import functools
+import itertools
+import hashlib
+import string
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from datetime import date, datetime
+
+# On-disk cache for raw Yahoo Finance downloads (override with MASCO_CACHE_DIR)
+CACHE_DIR = Path(os.environ.get("MASCO_CACHE_DIR", Path.home() / ".cache" / "masco"))
+
+
+def _read_cached_prices(cache_path):
+    """Read a cached price frame, or return None if it is missing or unreadable."""
+    try:
+        with np.load(cache_path, allow_pickle=False) as cached:
+            return pd.DataFrame(
+                cached["values"],
+                index=pd.DatetimeIndex(cached["index"], name="Date"),
+                columns=cached["columns"].tolist(),
+            )
+    except (OSError, ValueError, KeyError):
+        return None
+
 
-def load_data(stock_ticker="MAS", start="2005-01-01", end="2025-01-30"):
-    """Load stock data and calculate monthly returns."""
-    tickers = [stock_ticker, "^GSPC", "^W5000", "^TYX"]
+def _write_cached_prices(cache_path, raw):
+    """Persist a price frame as plain arrays; caching is best-effort."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent workers never read a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                index=raw.index.to_numpy(),
+                values=raw.to_numpy(dtype=np.float64),
+                columns=np.array(raw.columns, dtype=str),
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _fetch_prices(tickers, start, end):
+    """Download adjusted closes for `tickers` from Yahoo Finance.
     
-    raw = yf.download(
-        tickers,
+    Raises ValueError when any ticker comes back without data.
+    """
+    # group_by='ticker' skips yfinance's swap/sort into (field, ticker) columns;
+    # the adjusted closes are pulled out per ticker, in the requested order
+    data = yf.download(
+        list(tickers),
         start=start,
         end=end,
-        auto_adjust=False
-    )["Adj Close"]
+        auto_adjust=False,
+        group_by='ticker',
+        threads=True
+    )
+    if data.empty:
+        raw = pd.DataFrame(columns=list(tickers), dtype=np.float64)
+    elif isinstance(data.columns, pd.MultiIndex):
+        raw = pd.DataFrame({ticker: data[ticker]["Adj Close"] for ticker in tickers})
+    else:
+        # Older yfinance returns flat columns for a single ticker
+        raw = data[["Adj Close"]].set_axis(list(tickers), axis=1)
+    
+    # yfinance reports a failed ticker as an all-NaN column rather than raising
+    missing = raw.columns[raw.isna().all()].tolist() if not raw.empty else list(tickers)
+    if missing:
+        raise ValueError(f"No price data downloaded for {', '.join(missing)} between {start} and {end}")
+    return raw
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_prices(tickers, start, end):
+    """Adjusted closes for a closed period, cached in memory and on disk.
     
-    raw.columns = [stock_ticker, "SP500", "VW", "TYX"]
-    raw = raw.dropna()
+    Failed downloads raise, so they never reach either cache.
+    """
+    key = hashlib.blake2b(repr((tickers, start, end)).encode(), digest_size=16).hexdigest()
+    cache_path = CACHE_DIR / f"{key}.npz"
+    if cache_path.exists():
+        raw = _read_cached_prices(cache_path)
+        if raw is not None:
+            return raw
+    
+    raw = _fetch_prices(tickers, start, end)
+    _write_cached_prices(cache_path, raw)
+    return raw
+
+
+def _download_prices(tickers, start, end):
+    """Download adjusted closes for `tickers` between `start` and `end`.
     
-    # Convert to monthly prices (end of month)
-    monthly_prices = raw.resample("ME").last()
+    Periods that ended before today are cached in memory and on disk.
+    Periods ending today or later are still changing, so they are fetched
+    fresh on every call.
     
-    # Calculate log returns
-    returns = np.log(monthly_prices / monthly_prices.shift(1)).dropna()
+    The returned DataFrame may be shared between callers and must not be mutated.
+    """
+    if pd.Timestamp(end).date() < date.today():
+        return _cached_prices(tickers, start, end)
+    return _fetch_prices(tickers, start, end)
+
+
+# Market factor tickers and the column names used for them
+FACTOR_TICKERS = {"^GSPC": "SP500", "^W5000": "VW", "^TYX": "TYX"}
+
+# Factor columns quoted as yields (percent) rather than prices
+YIELD_COLUMNS = ("TYX",)
+
+
+def _load_factors(start, end):
+    """Load daily prices of the market factors (SP500, VW, TYX).
+    
+    The download is shared by every stock analysed over the same period.
+    """
+    raw = _download_prices(tuple(FACTOR_TICKERS), start, end)
+    return raw.rename(columns=FACTOR_TICKERS)[list(FACTOR_TICKERS.values())]
+
+
+def _load_one(stock_ticker, start, end):
+    """Load daily prices of a single stock."""
+    return _download_prices((stock_ticker,), start, end)[[stock_ticker]]
+
+
+def load_data(stock_ticker="MAS", start="2005-01-01", end="2025-01-30", factors=None):
+    """Load stock data and calculate monthly returns.
+    
+    `factors` optionally supplies daily factor prices already loaded for the
+    same period (as returned by _load_factors), instead of downloading them.
+    """
+    if factors is None:
+        factors = _load_factors(start, end)
+    raw = pd.concat([_load_one(stock_ticker, start, end), factors], axis=1)
+    raw = raw.dropna()
+    if raw.empty:
+        raise ValueError(
+            f"No overlapping price data for {stock_ticker} and the market factors between {start} and {end}"
+        )
+
+    # Convert to monthly prices (end of month): keep the last trading day of
+    # each month, labelled with the calendar month end like resample("ME")
+    dates = raw.index
+    month_key = dates.year * 12 + dates.month
+    last_idx = np.flatnonzero(np.r_[month_key[1:] != month_key[:-1], True])
+    monthly_prices = raw.to_numpy(dtype=np.float64)[last_idx]
+    monthly_index = dates[last_idx] + pd.offsets.MonthEnd(0)
+    
+    # Calculate log returns for prices; yields (TYX) are already rates, so
+    # their monthly change is a plain difference
+    is_yield = raw.columns.isin(YIELD_COLUMNS)
+    changes = np.empty((monthly_prices.shape[0] - 1, monthly_prices.shape[1]))
+    changes[:, ~is_yield] = np.diff(np.log(monthly_prices[:, ~is_yield]), axis=0)
+    changes[:, is_yield] = np.diff(monthly_prices[:, is_yield], axis=0)
+    returns = pd.DataFrame(changes, index=monthly_index[1:], columns=raw.columns)
     
     return returns
 
 
+# Regressors of each model, in table order; every model also has an intercept
+REGRESSION_MODELS = (
+    ("SP500",),
+    ("VW",),
+    ("TYX",),
+    ("SP500", "VW"),
+    ("SP500", "VW", "TYX"),
+)
+
+# Fitted OLS model exposing the statsmodels result attributes used in this project
+RegressionResult = namedtuple(
+    "RegressionResult",
+    ["params", "bse", "pvalues", "mse_resid", "rsquared", "rsquared_adj", "fvalue", "nobs", "df_resid"],
+)
+
+
 def run_regressions(returns, stock_ticker="MAS"):
     """Run all regression models and return fitted models."""
-    y = returns[stock_ticker]
-    
-    # Regression 1: MAS ~ SP500
-    X1 = sm.add_constant(returns["SP500"])
-    reg1 = sm.OLS(y, X1).fit()
-    
-    # Regression 2: MAS ~ VW
-    X2 = sm.add_constant(returns["VW"])
-    reg2 = sm.OLS(y, X2).fit()
-    
-    # Regression 3: MAS ~ TYX
-    X3 = sm.add_constant(returns["TYX"])
-    reg3 = sm.OLS(y, X3).fit()
-    
-    # Regression 4: MAS ~ SP500 + VW
-    X4 = sm.add_constant(returns[["SP500", "VW"]])
-    reg4 = sm.OLS(y, X4).fit()
+    names = ["const", "SP500", "VW", "TYX"]
+    y = returns[stock_ticker].to_numpy(dtype=np.float64)
+    n = y.size
+    X = np.column_stack([np.ones(n), returns[names[1:]].to_numpy(dtype=np.float64)])
+    tss = np.sum((y - y.mean()) ** 2)
+    
+    results = []
+    for regressors in REGRESSION_MODELS:
+        cols = [0] + [names.index(name) for name in regressors]
+        X_s = X[:, cols]
+        # Coefficients and their covariance both come from the SVD-based
+        # pseudo-inverse of X itself (as statsmodels' OLS does): SP500 and VW
+        # are nearly collinear, and going through X'X would square the
+        # condition number
+        pinv_X = linalg.pinv(X_s)
+        beta = pinv_X @ y
+        
+        resid = y - X_s @ beta
+        ssr = resid @ resid
+        df_resid = n - len(cols)
+        mse_resid = ssr / df_resid
+        bse = np.sqrt(mse_resid * np.einsum('ij,ij->i', pinv_X, pinv_X))
+        pvalues = 2 * student_t.sf(np.abs(beta / bse), df_resid)
+        rsquared = 1 - ssr / tss
+        
+        index = [names[c] for c in cols]
+        results.append(RegressionResult(
+            params=pd.Series(beta, index=index),
+            bse=pd.Series(bse, index=index),
+            pvalues=pd.Series(pvalues, index=index),
+            mse_resid=mse_resid,
+            rsquared=rsquared,
+            rsquared_adj=1 - (n - 1) / df_resid * (1 - rsquared),
+            fvalue=(tss - ssr) / len(regressors) / mse_resid,
+            nobs=float(n),
+            df_resid=float(df_resid),
+        ))
+    
+    return results
+
+
+# Column headers of the regression table (web app and PDF report)
+REGRESSION_TABLE_COLUMNS = ['Regression', 'Int.', 'S&P 500', 'Val.-Wgtd', '30 Yr Treas.', 'S,R²']
+
+# Significance thresholds; a p-value's star count is the number it falls below
+SIGNIFICANCE_THRESHOLDS = np.array([0.10, 0.05, 0.01])
+SIGNIFICANCE_STARS = np.array(['', '*', '**', '***'])
+
+
+def _significance_stars(pvalues):
+    """Map an array of p-values to star strings (NaN -> '')."""
+    codes = (pvalues[..., np.newaxis] < SIGNIFICANCE_THRESHOLDS).sum(axis=-1)
+    return np.take(SIGNIFICANCE_STARS, codes)
+
+
+# Values the regression tables read from one fitted model: name -> value
+# dicts of coefficients, standard errors and p-values, plus S and R²
+RegressionSummary = namedtuple("RegressionSummary", ["params", "bse", "pvalues", "resid_se", "rsquared"])
+
+
+def summarize_regressions(regressions):
+    """Extract what the regression tables need into plain dicts and floats.
     
-    # Regression 5: MAS ~ SP500 + VW + TYX
-    X5 = sm.add_constant(returns[["SP500", "VW", "TYX"]])
-    reg5 = sm.OLS(y, X5).fit()
+    Accepts any fitted results exposing params/bse/pvalues Series plus
+    mse_resid and rsquared (RegressionResult or statsmodels results).
+    """
+    n = len(regressions)
+    resid_se = np.sqrt(np.fromiter((reg.mse_resid for reg in regressions), dtype=np.float64, count=n))
+    rsquared = np.fromiter((reg.rsquared for reg in regressions), dtype=np.float64, count=n)
+    return [
+        RegressionSummary(
+            params=dict(zip(reg.params.index, reg.params.values)),
+            bse=dict(zip(reg.bse.index, reg.bse.values)),
+            pvalues=dict(zip(reg.pvalues.index, reg.pvalues.values)),
+            resid_se=resid_se[i],
+            rsquared=rsquared[i],
+        )
+        for i, reg in enumerate(regressions)
+    ]
+
+
+def _format_regression_rows(summary, var_names=('const', 'SP500', 'VW', 'TYX')):
+    """Format each summarized regression as a table row of strings.
     
-    return [reg1, reg2, reg3, reg4, reg5]
+    Rows are: model label, one "coef*** (se)" cell per variable (empty when
+    the model doesn't include it), and the "S, R²" cell.
+    """
+    # Coefficients of all models in one (n_models, n_vars) matrix, NaN where
+    # a model doesn't include the variable
+    shape = (len(summary), len(var_names))
+    params = np.full(shape, np.nan)
+    bse = np.full(shape, np.nan)
+    pvalues = np.full(shape, np.nan)
+    for i, reg in enumerate(summary):
+        for j, var_name in enumerate(var_names):
+            val = reg.params.get(var_name)
+            if val is not None:
+                params[i, j] = val
+                bse[i, j] = reg.bse.get(var_name, 0.0)
+                pvalues[i, j] = reg.pvalues.get(var_name, 1.0)
+    stars = _significance_stars(pvalues)
+    
+    rows = []
+    for i, reg in enumerate(summary):
+        row = [f"({i + 1})"]
+        for j in range(len(var_names)):
+            if np.isnan(params[i, j]):
+                row.append("")
+            else:
+                row.append(f"{params[i, j]:.4f}{stars[i, j]} ({bse[i, j]:.4f})")
+        
+        # S,R² column (Residual Std. Error and R²)
+        row.append(f"{reg.resid_se:.4f}, {reg.rsquared:.4f}")
+        rows.append(row)
+    return rows
 
 
 def create_regression_table_dataframe(regressions, stock_ticker="MAS", stock_name="MASCO"):
     """Create a DataFrame with regression results in the new format."""
-    # Helper function to create cell value with coefficient and standard error
-    def create_cell_value(reg, var_name):
-        if var_name in reg.params.index:
-            val = reg.params[var_name]
-            se = reg.bse.get(var_name, 0.0)
-            pval = reg.pvalues.get(var_name, 1.0)
-            sig = '***' if pval < 0.01 else '**' if pval < 0.05 else '*' if pval < 0.1 else ''
-            return f"{val:.4f}{sig} ({se:.4f})"
-        else:
-            return ""
-    
-    # Create data for the table
-    table_data = []
-    for i, reg in enumerate(regressions, 1):
-        row = {
-            'Regression': f'({i})',
-            'Int.': create_cell_value(reg, 'const'),
-            'S&P 500': create_cell_value(reg, 'SP500'),
-            'Val.-Wgtd': create_cell_value(reg, 'VW'),
-            '30 Yr Treas.': create_cell_value(reg, 'TYX'),
-        }
-        
-        # Add S,R² column (Residual Std. Error and R²)
-        resid_se = np.sqrt(reg.mse_resid)
-        r_squared = reg.rsquared
-        row['S,R²'] = f"{resid_se:.4f}, {r_squared:.4f}"
-        
-        table_data.append(row)
-    
-    # Create DataFrame
-    df = pd.DataFrame(table_data)
-    return df
+    return pd.DataFrame(_format_regression_rows(summarize_regressions(regressions)), columns=REGRESSION_TABLE_COLUMNS)
 
 
-def create_stargazer_table(regressions, stock_ticker="MAS", stock_name="MASCO"):
-    """Create and return Stargazer table HTML with improved styling for visibility."""
-    sg = Stargazer(regressions)
-    sg.title(f"{stock_name} ({stock_ticker}) Monthly Return Regressions (20 Years)")
-    sg.custom_columns(["(1)", "(2)", "(3)", "(4)", "(5)"], [1,1,1,1,1])
-    sg.significant_digits(4)
-    html_content = sg.render_html()
-    
-    # Add CSS styling to ensure table is visible with dark text
-    styled_html = f"""
+# Page fragment for the regression HTML table; the CSS ensures it is visible
+# with dark text. $content is replaced by the rendered table.
+_STARGAZER_TEMPLATE = string.Template("""
     <style>
-        .stargazer-table {{
+        .stargazer-table {
             color: #000000 !important;
             background-color: #ffffff !important;
-        }}
-        .stargazer-table table {{
+        }
+        .stargazer-table table {
             color: #000000 !important;
             background-color: #ffffff !important;
             border-collapse: collapse;
             width: 100%;
-        }}
+        }
         .stargazer-table th,
-        .stargazer-table td {{
+        .stargazer-table td {
             color: #000000 !important;
             background-color: #ffffff !important;
             border: 1px solid #cccccc;
             padding: 8px;
             text-align: left;
-        }}
-        .stargazer-table th {{
+        }
+        .stargazer-table th {
             background-color: #f0f0f0 !important;
             font-weight: bold;
-        }}
-        .stargazer-table tr:nth-child(even) {{
+        }
+        .stargazer-table tr:nth-child(even) {
             background-color: #f9f9f9 !important;
-        }}
-        .stargazer-table * {{
+        }
+        .stargazer-table * {
             color: #000000 !important;
-        }}
+        }
     </style>
     <div class="stargazer-table" style="background-color: #ffffff; color: #000000; padding: 20px;">
-        {html_content}
+        $content
     </div>
+    """)
+
+
+def _fit_key(regressions):
+    """Return a hashable snapshot of the fitted values the regression tables read.
+    
+    One (names, params, bse, pvalues, mse_resid, rsquared) tuple per model.
+    """
+    return tuple(
+        (tuple(reg.params.index), tuple(reg.params.values), tuple(reg.bse.values),
+         tuple(reg.pvalues.values), float(reg.mse_resid), float(reg.rsquared))
+        for reg in regressions
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _render_stargazer_html(fit, stock_ticker, stock_name):
+    """Format a fit snapshot (see _fit_key) and render it as styled HTML."""
+    summary = [
+        RegressionSummary(
+            params=dict(zip(names, params)),
+            bse=dict(zip(names, bse)),
+            pvalues=dict(zip(names, pvalues)),
+            resid_se=math.sqrt(mse_resid),
+            rsquared=rsquared,
+        )
+        for names, params, bse, pvalues, mse_resid, rsquared in fit
+    ]
+    table_df = pd.DataFrame(_format_regression_rows(summary), columns=REGRESSION_TABLE_COLUMNS)
+    html_content = (
+        f"<h3>{stock_name} ({stock_ticker}) Monthly Return Regressions (20 Years)</h3>"
+        + table_df.to_html(index=False)
+        + "<p>* p&lt;0.1; ** p&lt;0.05; *** p&lt;0.01</p>"
+    )
+    return _STARGAZER_TEMPLATE.substitute(content=html_content)
+
+
+def create_stargazer_table(regressions, stock_ticker="MAS", stock_name="MASCO"):
+    """Create and return Stargazer-style table HTML with improved styling for visibility.
+    
+    Not used by the web app. The HTML is cached per distinct fit, so a repeat
+    call for the same results skips the formatting pass entirely.
+    """
+    return _render_stargazer_html(_fit_key(regressions), stock_ticker, stock_name)
+
+
+def _fit_normal(values):
+    """Return the normal MLE (mean, population std) of `values`.
+    
+    Closed form, so no need for scipy's generic optimizer in norm.fit.
     """
-    return styled_html
+    values = np.asarray(values, dtype=np.float64)
+    return values.mean(), values.std(ddof=0)
 
 
 def plot_normal_distribution(returns, stock_ticker="MAS"):
@@ -167,16 +419,18 @@ def plot_normal_distribution(returns, stock_ticker="MAS"):
     stock_returns = returns[stock_ticker].dropna()
     
     # Fit normal distribution
-    mu, sigma = norm.fit(stock_returns)
+    mu, sigma = _fit_normal(stock_returns)
     
     # Create plot
+    values = stock_returns.to_numpy(dtype=np.float64)
+    edges = np.histogram_bin_edges(values, bins=25)
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.hist(stock_returns, bins=25, density=True, alpha=0.6, color='skyblue', label=f"{stock_ticker} Monthly Returns")
+    ax.hist(values, bins=edges, density=True, alpha=0.6, color='skyblue', label=f"{stock_ticker} Monthly Returns")
     
-    # Normal distribution curve
-    xmin, xmax = ax.get_xlim()
-    xx = np.linspace(xmin, xmax, 200)
-    yy = norm.pdf(xx, mu, sigma)
+    # Normal distribution curve over the histogram's range
+    xx = np.linspace(edges[0], edges[-1], 200)
+    inv_sigma = 1.0 / sigma
+    yy = (inv_sigma / math.sqrt(2 * math.pi)) * np.exp(-0.5 * ((xx - mu) * inv_sigma) ** 2)
     ax.plot(xx, yy, 'r', linewidth=2, label=f"Normal Fit (μ={mu:.4f}, σ={sigma:.4f})")
     
     ax.set_title(f"{stock_ticker} Monthly Returns with Normal Distribution Fit")
@@ -185,27 +439,34 @@ def plot_normal_distribution(returns, stock_ticker="MAS"):
     ax.legend()
     ax.grid(True)
     
-    plt.tight_layout()
+    # Fixed margins instead of tight_layout/bbox_inches='tight', which each
+    # need an extra layout pass when the figure is rendered
+    fig.subplots_adjust(left=0.1, right=0.95, top=0.92, bottom=0.12)
+    # Keep the fit on the figure so the PDF report doesn't refit it
+    fig._normal_fit = (mu, sigma)
     return fig
 
 
+def _empirical_cdf(values):
+    """Return sorted values and their empirical CDF probabilities i/n."""
+    x = np.sort(np.asarray(values, dtype=np.float64))
+    n = x.size
+    return x, np.arange(1, n + 1, dtype=np.float64) / n
+
+
 def plot_cdf(returns, stock_ticker="MAS"):
     """Create CDF plot and return figure."""
     stock_returns = returns[stock_ticker].dropna()
     sp = returns["SP500"].dropna()
     
-    # Sort returns
-    stock_sorted = np.sort(stock_returns)
-    sp_sorted = np.sort(sp)
-    
-    # Cumulative probabilities
-    p_stock = np.linspace(0, 1, len(stock_sorted))
-    p_sp = np.linspace(0, 1, len(sp_sorted))
+    # Sorted returns and their cumulative probabilities
+    stock_sorted, p_stock = _empirical_cdf(stock_returns.to_numpy())
+    sp_sorted, p_sp = _empirical_cdf(sp.to_numpy())
 
-    # Create plot
+    # Create plot (an empirical CDF is a step function)
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.scatter(stock_sorted, p_stock, s=20, marker='^', color="red", alpha=0.7, label=stock_ticker)
-    ax.scatter(sp_sorted, p_sp, s=20, marker='s', color="blue", alpha=0.7, label="S&P 500")
+    ax.plot(stock_sorted, p_stock, drawstyle='steps-post', color="red", label=stock_ticker)
+    ax.plot(sp_sorted, p_sp, drawstyle='steps-post', color="blue", label="S&P 500")
     
     ax.set_title(f"Distribution of Monthly Returns: {stock_ticker} vs S&P 500")
     ax.set_xlabel("Return")
@@ -213,296 +474,285 @@ def plot_cdf(returns, stock_ticker="MAS"):
     ax.grid(True)
     ax.legend()
     
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.1, right=0.95, top=0.92, bottom=0.12)
     return fig
 
 
-def generate_pdf_report(returns, regressions, fig_normal, fig_cdf, start_date, end_date, stock_ticker="MAS", stock_name="MASCO"):
-    """Generate a PDF report with all analysis results."""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
-                          rightMargin=0.75*inch, leftMargin=0.75*inch,
-                          topMargin=0.75*inch, bottomMargin=0.75*inch)
-    
-    # Container for the 'Flowable' objects
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    title = Paragraph(f"{stock_name} ({stock_ticker}) Stock Returns Analysis", title_style)
-    elements.append(title)
-    
-    # Subtitle
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=12,
-        alignment=TA_CENTER,
-        spaceAfter=20
-    )
-    subtitle = Paragraph(f"Analysis Period: {start_date} to {end_date}", subtitle_style)
-    elements.append(subtitle)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # Style definitions for interpretation section (used later)
-    intro_style = ParagraphStyle(
-        'IntroStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=8,
-        leftIndent=0
-    )
-    
-    intro_title_style = ParagraphStyle(
-        'IntroTitle',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=colors.HexColor('#1f77b4'),
-        spaceAfter=10
-    )
+# ReportLab styles and static tutorial text for the PDF report, built once at import
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    textColor=colors.HexColor('#1f77b4'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    alignment=TA_CENTER,
+    spaceAfter=20
+)
+
+_INSTRUCTION_STYLE = ParagraphStyle(
+    'InstructionStyle',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    leftIndent=0,
+    spaceAfter=6
+)
+
+_BULLET_STYLE = ParagraphStyle(
+    'BulletStyle',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    leftIndent=20,
+    spaceAfter=4,
+    bulletIndent=10
+)
+
+_FOOTER_STYLE = ParagraphStyle('Footer', parent=_STYLES['Normal'], fontSize=8, alignment=TA_CENTER)
+
+_REG_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+])
+
+_EXCEL_INSTRUCTIONS = (
+    ("<b>Step 1: Prepare Your Data</b>", (
+        "1. Download monthly stock price data from Yahoo Finance or other sources",
+        "2. Calculate monthly returns using the formula: =LN(Price_t / Price_{t-1})",
+        "   For the 30-Year Treasury (a yield), use the change instead: =Yield_t - Yield_{t-1}",
+        "3. Organize your data in columns: Date, Stock Returns, S&P 500 Returns, Value-Weighted Returns, 30-Year Treasury Returns"
+    )),
+    ("<b>Step 2: Install Data Analysis ToolPak</b>", (
+        "1. Go to File → Options → Add-ins",
+        "2. Select 'Analysis ToolPak' and click 'Go'",
+        "3. Check the box for 'Analysis ToolPak' and click 'OK'",
+        "4. You should now see 'Data Analysis' in the Data tab"
+    )),
+    ("<b>Step 3: Run Regression Analysis</b>", (
+        "1. Go to Data → Data Analysis → Regression",
+        "2. <b>Input Y Range:</b> Select your stock returns column (dependent variable)",
+        "3. <b>Input X Range:</b> Select your independent variables (S&P 500, VW, TYX)",
+        "4. Check 'Labels' if your first row contains headers",
+        "5. Choose an output range or new worksheet",
+        "6. Click 'OK' to run the regression"
+    )),
+    ("<b>Step 4: Interpret the Results</b>", (
+        "• <b>Coefficients:</b> Found in the 'Coefficients' column - these show the relationship strength",
+        "• <b>Standard Error:</b> Found in the 'Standard Error' column - measures coefficient precision",
+        "• <b>P-value:</b> Found in the 'P-value' column - indicates statistical significance",
+        "• <b>R-squared:</b> Found in 'Regression Statistics' - shows how well the model fits (0 to 1)",
+        "• <b>Residual Standard Error:</b> Found in 'Regression Statistics' - measures prediction accuracy"
+    )),
+    ("<b>Step 5: Multiple Regressions</b>", (
+        "To run different models (like in the table above):",
+        "• <b>Model (1):</b> Y = Stock Returns, X = S&P 500 only",
+        "• <b>Model (2):</b> Y = Stock Returns, X = Value-Weighted only",
+        "• <b>Model (3):</b> Y = Stock Returns, X = 30-Year Treasury only",
+        "• <b>Model (4):</b> Y = Stock Returns, X = S&P 500 + Value-Weighted",
+        "• <b>Model (5):</b> Y = Stock Returns, X = S&P 500 + Value-Weighted + 30-Year Treasury",
+        "Run each regression separately and compile results into a table"
+    )),
+    ("<b>Step 6: Significance Testing</b>", (
+        "• If P-value < 0.01: Highly significant (***)",
+        "• If P-value < 0.05: Significant (**)",
+        "• If P-value < 0.10: Marginally significant (*)",
+        "• If P-value ≥ 0.10: Not significant"
+    )),
+)
+
+
+_NORMAL_DIST_INSTRUCTIONS = (
+    ("<b>Step 1: Calculate Statistics</b>", (
+        "1. Calculate mean: =AVERAGE(returns_range)",
+        "2. Calculate standard deviation: =STDEV.S(returns_range)",
+        "3. Create bins for histogram: Create a column with bin ranges (e.g., -0.15, -0.10, -0.05, 0, 0.05, 0.10, 0.15)"
+    )),
+    ("<b>Step 2: Create Histogram</b>", (
+        "1. Select your returns data",
+        "2. Go to Insert → Charts → Histogram (or use Data Analysis → Histogram)",
+        "3. If using Data Analysis:",
+        "   • Input Range: Select your returns data",
+        "   • Bin Range: Select your bin ranges",
+        "   • Check 'Chart Output'",
+        "4. Format the histogram: Right-click → Format Data Series → Adjust gap width"
+    )),
+    ("<b>Step 3: Add Normal Distribution Curve</b>", (
+        "1. Create a new column for normal distribution values",
+        "2. Use formula: =NORM.DIST(x, mean, std_dev, FALSE) where:",
+        "   • x = bin value",
+        "   • mean = calculated mean from Step 1",
+        "   • std_dev = calculated standard deviation from Step 1",
+        "   • FALSE = returns probability density (not cumulative)",
+        "3. Create a scatter plot with your bin values and normal distribution values",
+        "4. Add this as a line series to your histogram chart",
+        "5. Right-click chart → Select Data → Add → Select normal distribution data"
+    )),
+    ("<b>Step 4: Format the Chart</b>", (
+        "1. Add chart title: 'Stock Returns with Normal Distribution Fit'",
+        "2. Label axes: X-axis = 'Monthly Return', Y-axis = 'Density'",
+        "3. Add legend to distinguish histogram from normal curve",
+        "4. Format histogram bars: Set transparency (alpha) to ~60%",
+        "5. Format normal curve: Use a different color (e.g., red) with thicker line"
+    )),
+)
+
+
+_CDF_INSTRUCTIONS = (
+    ("<b>Step 1: Prepare Data</b>", (
+        "1. Sort your returns data in descending order: Select data → Data → Sort → Largest to Smallest",
+        "2. Create a column for cumulative probability",
+        "3. Use formula: =1-ROW()/COUNT($A$2:$A$N) where N is your last row",
+        "   Or use: =1-(ROW()-1)/(COUNT(A:A)-1) if starting from row 2",
+        "4. This creates values from 0 to 1 representing cumulative probability"
+    )),
+    ("<b>Step 2: Create Scatter Plot</b>", (
+        "1. Select both columns: sorted returns and cumulative probability",
+        "2. Go to Insert → Charts → Scatter → Scatter with Markers",
+        "3. Excel will create a scatter plot with your data points"
+    )),
+    ("<b>Step 3: Add Second Series (for Comparison)</b>", (
+        "1. Right-click on the chart → Select Data",
+        "2. Click 'Add' to add a new series",
+        "3. Series name: 'S&P 500' (or your comparison stock)",
+        "4. X values: Select sorted S&P 500 returns",
+        "5. Y values: Select cumulative probability for S&P 500",
+        "6. Click OK to add the series"
+    )),
+    ("<b>Step 4: Format the Chart</b>", (
+        "1. Change marker styles:",
+        "   • Right-click first series → Format Data Series → Marker Options",
+        "   • Choose different marker (e.g., triangles ^ for Stock)",
+        "   • Right-click second series → Choose different marker (e.g., squares for S&P 500)",
+        "2. Change colors:",
+        "   • Format Data Series → Marker Fill → Choose colors (e.g., red for Stock, blue for S&P 500)",
+        "3. Add chart title: 'Distribution of Monthly Returns: Stock vs S&P 500'",
+        "4. Label axes:",
+        "   • X-axis: 'Return'",
+        "   • Y-axis: 'Cumulative Probability'",
+        "5. Add legend: Chart Tools → Add Chart Element → Legend"
+    )),
+    ("<b>Step 5: Adjust Transparency</b>", (
+        "1. Right-click each data series → Format Data Series",
+        "2. Go to Marker Fill → Transparency",
+        "3. Set transparency to ~30% (0.3) for better visibility",
+        "4. Adjust marker size if needed: Marker Options → Size"
+    )),
+    ("<b>Step 6: Add Gridlines (Optional)</b>", (
+        "1. Right-click chart → Add Chart Element → Gridlines",
+        "2. Choose Primary Major Horizontal and/or Vertical gridlines",
+        "3. This helps with reading values from the chart"
+    )),
+)
+
+
+def _fig_to_image(fig, width, height):
+    """Render a matplotlib figure to a ReportLab Image flowable.
     
-    # Page 1: Regression Table
-    elements.append(Paragraph(f"{stock_name} ({stock_ticker}) Monthly Return Regressions", styles['Heading2']))
-    elements.append(Spacer(1, 0.2*inch))
+    The image is drawn 6.5in wide (~470pt), so 100 DPI is plenty. ReportLab
+    decodes and recompresses the pixels itself, so PNG compression is kept
+    at its fastest level. The plots set their own margins, so the full
+    canvas is saved without a bbox_inches='tight' trial render.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=100,
+                pil_kwargs={'optimize': False, 'compress_level': 1})
+    buffer.seek(0)
+    return Image(buffer, width=width, height=height)
+
+
+def _instruction_flowables(instructions):
+    """Yield the step titles and bullet items of an Excel tutorial."""
+    for title, items in instructions:
+        yield Paragraph(title, _INSTRUCTION_STYLE)
+        yield Spacer(1, 0.1*inch)
+        for item in items:
+            yield Paragraph(f"• {item}", _BULLET_STYLE)
+        yield Spacer(1, 0.15*inch)
+
+
+def _title_section(start_date, end_date, stock_ticker, stock_name):
+    """Yield the report title and analysis period."""
+    yield Paragraph(f"{stock_name} ({stock_ticker}) Stock Returns Analysis", _TITLE_STYLE)
+    yield Paragraph(f"Analysis Period: {start_date} to {end_date}", _SUBTITLE_STYLE)
+    yield Spacer(1, 0.3*inch)
+
+
+def _regression_section(regressions, stock_ticker, stock_name):
+    """Yield page 1: the regression table and its Excel tutorial."""
+    yield Paragraph(f"{stock_name} ({stock_ticker}) Monthly Return Regressions", _STYLES['Heading2'])
+    yield Spacer(1, 0.2*inch)
     
     # Create regression table in the new format: Regression | Int. | S&P 500 | Val.-Wgtd | 30 Yr Treas. | S,R²
-    # Map variable names to display names
-    var_display_map = {
-        'const': 'Int.',
-        'SP500': 'S&P 500',
-        'VW': 'Val.-Wgtd',
-        'TYX': '30 Yr Treas.'
-    }
-    
-    # Helper function to create cell with coefficient and standard error
-    def create_cell_value(reg, var_name):
-        if var_name in reg.params.index:
-            val = reg.params[var_name]
-            se = reg.bse.get(var_name, 0.0)
-            pval = reg.pvalues.get(var_name, 1.0)
-            sig = '***' if pval < 0.01 else '**' if pval < 0.05 else '*' if pval < 0.1 else ''
-            # Format: coefficient with stars, standard error in parentheses on same line
-            return f"{val:.4f}{sig} ({se:.4f})"
-        else:
-            return ""
-    
-    # Create table header
-    table_data = [['Regression', 'Int.', 'S&P 500', 'Val.-Wgtd', '30 Yr Treas.', 'S,R²']]
-    
-    # Add rows for each regression
-    for i, reg in enumerate(regressions, 1):
-        row = [f"({i})"]
-        
-        # Add intercept
-        row.append(create_cell_value(reg, 'const'))
-        
-        # Add S&P 500
-        row.append(create_cell_value(reg, 'SP500'))
-        
-        # Add Val.-Wgtd (VW)
-        row.append(create_cell_value(reg, 'VW'))
-        
-        # Add 30 Yr Treas. (TYX)
-        row.append(create_cell_value(reg, 'TYX'))
-        
-        # Add S,R² column (Residual Std. Error and R²)
-        resid_se = np.sqrt(reg.mse_resid)
-        r_squared = reg.rsquared
-        row.append(f"{resid_se:.4f}, {r_squared:.4f}")
-        
-        table_data.append(row)
+    table_data = [REGRESSION_TABLE_COLUMNS] + _format_regression_rows(summarize_regressions(regressions))
     
     # Create table with proper column widths
     reg_table = Table(table_data, colWidths=[0.8*inch, 1.2*inch, 1.2*inch, 1.2*inch, 1.2*inch, 1.2*inch])
-    reg_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-    ]))
-    elements.append(reg_table)
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph("* p<0.1; ** p<0.05; *** p<0.01", styles['Normal']))
+    reg_table.setStyle(_REG_TABLE_STYLE)
+    yield reg_table
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph("* p<0.1; ** p<0.05; *** p<0.01", _STYLES['Normal'])
     
     # Add Excel Tutorial Section
-    elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("How to Perform This Analysis in Excel", styles['Heading2']))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    # Excel tutorial content
-    excel_instructions = [
-        ("<b>Step 1: Prepare Your Data</b>", [
-            "1. Download monthly stock price data from Yahoo Finance or other sources",
-            "2. Calculate monthly returns using the formula: =LN(Price_t / Price_{t-1})",
-            "3. Organize your data in columns: Date, Stock Returns, S&P 500 Returns, Value-Weighted Returns, 30-Year Treasury Returns"
-        ]),
-        ("<b>Step 2: Install Data Analysis ToolPak</b>", [
-            "1. Go to File → Options → Add-ins",
-            "2. Select 'Analysis ToolPak' and click 'Go'",
-            "3. Check the box for 'Analysis ToolPak' and click 'OK'",
-            "4. You should now see 'Data Analysis' in the Data tab"
-        ]),
-        ("<b>Step 3: Run Regression Analysis</b>", [
-            "1. Go to Data → Data Analysis → Regression",
-            "2. <b>Input Y Range:</b> Select your stock returns column (dependent variable)",
-            "3. <b>Input X Range:</b> Select your independent variables (S&P 500, VW, TYX)",
-            "4. Check 'Labels' if your first row contains headers",
-            "5. Choose an output range or new worksheet",
-            "6. Click 'OK' to run the regression"
-        ]),
-        ("<b>Step 4: Interpret the Results</b>", [
-            "• <b>Coefficients:</b> Found in the 'Coefficients' column - these show the relationship strength",
-            "• <b>Standard Error:</b> Found in the 'Standard Error' column - measures coefficient precision",
-            "• <b>P-value:</b> Found in the 'P-value' column - indicates statistical significance",
-            "• <b>R-squared:</b> Found in 'Regression Statistics' - shows how well the model fits (0 to 1)",
-            "• <b>Residual Standard Error:</b> Found in 'Regression Statistics' - measures prediction accuracy"
-        ]),
-        ("<b>Step 5: Multiple Regressions</b>", [
-            "To run different models (like in the table above):",
-            "• <b>Model (1):</b> Y = Stock Returns, X = S&P 500 only",
-            "• <b>Model (2):</b> Y = Stock Returns, X = Value-Weighted only",
-            "• <b>Model (3):</b> Y = Stock Returns, X = 30-Year Treasury only",
-            "• <b>Model (4):</b> Y = Stock Returns, X = S&P 500 + Value-Weighted",
-            "• <b>Model (5):</b> Y = Stock Returns, X = S&P 500 + Value-Weighted + 30-Year Treasury",
-            "Run each regression separately and compile results into a table"
-        ]),
-        ("<b>Step 6: Significance Testing</b>", [
-            "• If P-value < 0.01: Highly significant (***)",
-            "• If P-value < 0.05: Significant (**)",
-            "• If P-value < 0.10: Marginally significant (*)",
-            "• If P-value ≥ 0.10: Not significant"
-        ])
-    ]
-    
-    # Create styled paragraphs for instructions
-    instruction_style = ParagraphStyle(
-        'InstructionStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        leftIndent=0,
-        spaceAfter=6
-    )
-    
-    bullet_style = ParagraphStyle(
-        'BulletStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        leftIndent=20,
-        spaceAfter=4,
-        bulletIndent=10
-    )
-    
-    for title, items in excel_instructions:
-        elements.append(Paragraph(title, instruction_style))
-        elements.append(Spacer(1, 0.1*inch))
-        for item in items:
-            elements.append(Paragraph(f"• {item}", bullet_style))
-        elements.append(Spacer(1, 0.15*inch))
-    
-    # Page break
-    elements.append(PageBreak())
-    
-    # Page 2: Normal Distribution
-    elements.append(Paragraph("Normal Distribution Fit", styles['Heading2']))
-    elements.append(Spacer(1, 0.2*inch))
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph("How to Perform This Analysis in Excel", _STYLES['Heading2'])
+    yield Spacer(1, 0.15*inch)
+    yield from _instruction_flowables(_EXCEL_INSTRUCTIONS)
+
+
+def _normal_section(returns, fig_normal, stock_ticker):
+    """Yield page 2: the normal distribution fit and its Excel tutorial."""
+    yield Paragraph("Normal Distribution Fit", _STYLES['Heading2'])
+    yield Spacer(1, 0.2*inch)
     
     # Convert matplotlib figure to image
-    img_buffer = io.BytesIO()
-    fig_normal.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-    img_buffer.seek(0)
-    img_normal = Image(img_buffer, width=6.5*inch, height=4*inch)
-    elements.append(img_normal)
+    yield _fig_to_image(fig_normal, width=6.5*inch, height=3.9*inch)
     
     # Add distribution parameters
-    stock_returns = returns[stock_ticker].dropna()
-    mu, sigma = norm.fit(stock_returns)
-    elements.append(Spacer(1, 0.2*inch))
-    elements.append(Paragraph(f"Mean (μ): {mu:.4f}", styles['Normal']))
-    elements.append(Paragraph(f"Standard Deviation (σ): {sigma:.4f}", styles['Normal']))
-    elements.append(Paragraph(f"Variance (σ²): {sigma**2:.4f}", styles['Normal']))
+    normal_fit = getattr(fig_normal, '_normal_fit', None)
+    mu, sigma = normal_fit if normal_fit is not None else _fit_normal(returns[stock_ticker].dropna())
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph(f"Mean (μ): {mu:.4f}", _STYLES['Normal'])
+    yield Paragraph(f"Standard Deviation (σ): {sigma:.4f}", _STYLES['Normal'])
+    yield Paragraph(f"Variance (σ²): {sigma**2:.4f}", _STYLES['Normal'])
     
     # Add Excel tutorial for Normal Distribution
-    elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("How to Create Normal Distribution Graph in Excel", styles['Heading2']))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    normal_dist_instructions = [
-        ("<b>Step 1: Calculate Statistics</b>", [
-            "1. Calculate mean: =AVERAGE(returns_range)",
-            "2. Calculate standard deviation: =STDEV.S(returns_range)",
-            "3. Create bins for histogram: Create a column with bin ranges (e.g., -0.15, -0.10, -0.05, 0, 0.05, 0.10, 0.15)"
-        ]),
-        ("<b>Step 2: Create Histogram</b>", [
-            "1. Select your returns data",
-            "2. Go to Insert → Charts → Histogram (or use Data Analysis → Histogram)",
-            "3. If using Data Analysis:",
-            "   • Input Range: Select your returns data",
-            "   • Bin Range: Select your bin ranges",
-            "   • Check 'Chart Output'",
-            "4. Format the histogram: Right-click → Format Data Series → Adjust gap width"
-        ]),
-        ("<b>Step 3: Add Normal Distribution Curve</b>", [
-            "1. Create a new column for normal distribution values",
-            "2. Use formula: =NORM.DIST(x, mean, std_dev, FALSE) where:",
-            "   • x = bin value",
-            "   • mean = calculated mean from Step 1",
-            "   • std_dev = calculated standard deviation from Step 1",
-            "   • FALSE = returns probability density (not cumulative)",
-            "3. Create a scatter plot with your bin values and normal distribution values",
-            "4. Add this as a line series to your histogram chart",
-            "5. Right-click chart → Select Data → Add → Select normal distribution data"
-        ]),
-        ("<b>Step 4: Format the Chart</b>", [
-            "1. Add chart title: 'Stock Returns with Normal Distribution Fit'",
-            "2. Label axes: X-axis = 'Monthly Return', Y-axis = 'Density'",
-            "3. Add legend to distinguish histogram from normal curve",
-            "4. Format histogram bars: Set transparency (alpha) to ~60%",
-            "5. Format normal curve: Use a different color (e.g., red) with thicker line"
-        ])
-    ]
-    
-    for title, items in normal_dist_instructions:
-        elements.append(Paragraph(title, instruction_style))
-        elements.append(Spacer(1, 0.1*inch))
-        for item in items:
-            elements.append(Paragraph(f"• {item}", bullet_style))
-        elements.append(Spacer(1, 0.15*inch))
-    
-    # Page break
-    elements.append(PageBreak())
-    
-    # Page 3: CDF Graph
-    elements.append(Paragraph("Cumulative Distribution Function (CDF)", styles['Heading2']))
-    elements.append(Spacer(1, 0.2*inch))
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph("How to Create Normal Distribution Graph in Excel", _STYLES['Heading2'])
+    yield Spacer(1, 0.15*inch)
+    yield from _instruction_flowables(_NORMAL_DIST_INSTRUCTIONS)
+
+
+def _cdf_section(returns, fig_cdf, stock_ticker):
+    """Yield page 3: the CDF comparison and its Excel tutorial."""
+    yield Paragraph("Cumulative Distribution Function (CDF)", _STYLES['Heading2'])
+    yield Spacer(1, 0.2*inch)
     
     # Convert CDF figure to image
-    img_buffer2 = io.BytesIO()
-    fig_cdf.savefig(img_buffer2, format='png', dpi=150, bbox_inches='tight')
-    img_buffer2.seek(0)
-    img_cdf = Image(img_buffer2, width=6.5*inch, height=4*inch)
-    elements.append(img_cdf)
+    yield _fig_to_image(fig_cdf, width=6.5*inch, height=3.9*inch)
     
     # Add comparison statistics
-    elements.append(Spacer(1, 0.2*inch))
+    yield Spacer(1, 0.2*inch)
+    stock_returns = returns[stock_ticker].dropna()
     sp = returns["SP500"].dropna()
     stats_text = f"""
     <b>{stock_ticker} Statistics:</b><br/>
@@ -510,74 +760,75 @@ def generate_pdf_report(returns, regressions, fig_normal, fig_cdf, start_date, e
     <b>S&P 500 Statistics:</b><br/>
     Mean: {sp.mean():.4f}, Std Dev: {sp.std():.4f}, Min: {sp.min():.4f}, Max: {sp.max():.4f}
     """
-    elements.append(Paragraph(stats_text, styles['Normal']))
+    yield Paragraph(stats_text, _STYLES['Normal'])
     
     # Add Excel tutorial for CDF Graph
-    elements.append(Spacer(1, 0.3*inch))
-    elements.append(Paragraph("How to Create CDF Graph in Excel", styles['Heading2']))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    cdf_instructions = [
-        ("<b>Step 1: Prepare Data</b>", [
-            "1. Sort your returns data in descending order: Select data → Data → Sort → Largest to Smallest",
-            "2. Create a column for cumulative probability",
-            "3. Use formula: =1-ROW()/COUNT($A$2:$A$N) where N is your last row",
-            "   Or use: =1-(ROW()-1)/(COUNT(A:A)-1) if starting from row 2",
-            "4. This creates values from 0 to 1 representing cumulative probability"
-        ]),
-        ("<b>Step 2: Create Scatter Plot</b>", [
-            "1. Select both columns: sorted returns and cumulative probability",
-            "2. Go to Insert → Charts → Scatter → Scatter with Markers",
-            "3. Excel will create a scatter plot with your data points"
-        ]),
-        ("<b>Step 3: Add Second Series (for Comparison)</b>", [
-            "1. Right-click on the chart → Select Data",
-            "2. Click 'Add' to add a new series",
-            "3. Series name: 'S&P 500' (or your comparison stock)",
-            "4. X values: Select sorted S&P 500 returns",
-            "5. Y values: Select cumulative probability for S&P 500",
-            "6. Click OK to add the series"
-        ]),
-        ("<b>Step 4: Format the Chart</b>", [
-            "1. Change marker styles:",
-            "   • Right-click first series → Format Data Series → Marker Options",
-            "   • Choose different marker (e.g., triangles ^ for Stock)",
-            "   • Right-click second series → Choose different marker (e.g., squares for S&P 500)",
-            "2. Change colors:",
-            "   • Format Data Series → Marker Fill → Choose colors (e.g., red for Stock, blue for S&P 500)",
-            "3. Add chart title: 'Distribution of Monthly Returns: Stock vs S&P 500'",
-            "4. Label axes:",
-            "   • X-axis: 'Return'",
-            "   • Y-axis: 'Cumulative Probability'",
-            "5. Add legend: Chart Tools → Add Chart Element → Legend"
-        ]),
-        ("<b>Step 5: Adjust Transparency</b>", [
-            "1. Right-click each data series → Format Data Series",
-            "2. Go to Marker Fill → Transparency",
-            "3. Set transparency to ~30% (0.3) for better visibility",
-            "4. Adjust marker size if needed: Marker Options → Size"
-        ]),
-        ("<b>Step 6: Add Gridlines (Optional)</b>", [
-            "1. Right-click chart → Add Chart Element → Gridlines",
-            "2. Choose Primary Major Horizontal and/or Vertical gridlines",
-            "3. This helps with reading values from the chart"
-        ])
-    ]
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph("How to Create CDF Graph in Excel", _STYLES['Heading2'])
+    yield Spacer(1, 0.15*inch)
+    yield from _instruction_flowables(_CDF_INSTRUCTIONS)
+
+
+def _footer_section():
+    """Yield the generation timestamp footer."""
+    yield Spacer(1, 0.5*inch)
+    yield Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Data Source: Yahoo Finance", _FOOTER_STYLE)
+
+
+def generate_pdf_report(returns, regressions, fig_normal, fig_cdf, start_date, end_date, stock_ticker="MAS", stock_name="MASCO"):
+    """Generate a PDF report with all analysis results."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                          rightMargin=0.75*inch, leftMargin=0.75*inch,
+                          topMargin=0.75*inch, bottomMargin=0.75*inch,
+                          pageCompression=1)
+    
+    # Each section yields its 'Flowable' objects
+    sections = (
+        _title_section(start_date, end_date, stock_ticker, stock_name),
+        _regression_section(regressions, stock_ticker, stock_name),
+        [PageBreak()],
+        _normal_section(returns, fig_normal, stock_ticker),
+        [PageBreak()],
+        _cdf_section(returns, fig_cdf, stock_ticker),
+        _footer_section(),
+    )
     
-    for title, items in cdf_instructions:
-        elements.append(Paragraph(title, instruction_style))
-        elements.append(Spacer(1, 0.1*inch))
-        for item in items:
-            elements.append(Paragraph(f"• {item}", bullet_style))
-        elements.append(Spacer(1, 0.15*inch))
+    # Build PDF (doc.build consumes a list, popping flowables as it lays them out)
+    doc.build(list(itertools.chain.from_iterable(sections)))
+    buffer.seek(0)
+    return buffer
+
+
+def build_report(stock_ticker="MAS", start="2005-01-01", end="2025-01-30", stock_name=None, factors=None):
+    """Run the full analysis for one stock and return the PDF report as bytes.
     
-    # Footer
-    elements.append(Spacer(1, 0.5*inch))
-    footer = Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Data Source: Yahoo Finance", 
-                      ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, alignment=TA_CENTER))
-    elements.append(footer)
+    Everything (figures, buffers) stays inside the call, so it is safe to run
+    in a worker process. `factors` is passed through to load_data.
+    """
+    returns = load_data(stock_ticker, start, end, factors=factors)
+    regressions = run_regressions(returns, stock_ticker)
+    fig_normal = plot_normal_distribution(returns, stock_ticker)
+    fig_cdf = plot_cdf(returns, stock_ticker)
+    try:
+        pdf = generate_pdf_report(returns, regressions, fig_normal, fig_cdf, start, end,
+                                  stock_ticker, stock_name or stock_ticker)
+    finally:
+        plt.close(fig_normal)
+        plt.close(fig_cdf)
+    return pdf.getvalue()
+
+
+def build_reports(stock_tickers, start="2005-01-01", end="2025-01-30", max_workers=None):
+    """Build PDF reports for several stocks in parallel.
     
-    # Build PDF
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer
\ No newline at end of file
+    Returns a dict mapping each ticker to its PDF bytes.
+    """
+    stock_tickers = list(stock_tickers)
+    # Fetch the shared factor prices once and hand them to every worker. Workers
+    # can't rely on the parent's caches: spawn/forkserver start them empty, and
+    # open periods are never cached.
+    factors = _load_factors(start, end)
+    worker = functools.partial(build_report, start=start, end=end, factors=factors)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        return dict(zip(stock_tickers, ex.map(worker, stock_tickers)))
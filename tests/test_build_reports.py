@@ -0,0 +1,44 @@
+"""masco_2025.build_reports, with yfinance mocked out."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import masco_2025 as masco
+
+
+def fake_download(tickers, start=None, end=None, group_by=None, **kwargs):
+    """Stand-in for yf.download(group_by='ticker'): a random walk per ticker."""
+    index = pd.bdate_range(start, end, inclusive="left", name="Date")
+    columns = pd.MultiIndex.from_product([sorted(tickers), ["Adj Close", "Close"]])
+    rng = np.random.default_rng(len(tickers))
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (len(index), len(columns))), axis=0))
+    return pd.DataFrame(prices, index=index, columns=columns)
+
+
+class BuildReportsTest(unittest.TestCase):
+
+    def test_factors_are_downloaded_once(self):
+        # An open period is never cached, so any factor download in a worker
+        # would show up in the call count. Threads stand in for processes so
+        # the mock sees the workers' calls.
+        start = (date.today() - timedelta(days=365)).isoformat()
+        end = (date.today() + timedelta(days=1)).isoformat()
+        download = mock.Mock(side_effect=fake_download)
+        with mock.patch.object(masco.yf, "download", download), \
+                mock.patch.object(masco, "ProcessPoolExecutor", ThreadPoolExecutor):
+            pdfs = masco.build_reports(["MAS", "LMT"], start, end, max_workers=1)
+
+        self.assertEqual(list(pdfs), ["MAS", "LMT"])
+        for pdf in pdfs.values():
+            self.assertTrue(pdf.startswith(b"%PDF-"))
+        downloaded = sorted(tuple(call.args[0]) for call in download.call_args_list)
+        self.assertEqual(downloaded, [("LMT",), ("MAS",), tuple(masco.FACTOR_TICKERS)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Caching rules of masco_2025._download_prices, with yfinance mocked out."""
+
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import masco_2025 as masco
+
+
+def fake_download(tickers, start=None, end=None, group_by=None, **kwargs):
+    """Stand-in for yf.download(group_by='ticker'): a random walk per ticker."""
+    index = pd.bdate_range(start, pd.Timestamp(start) + pd.Timedelta(days=120), name="Date")
+    columns = pd.MultiIndex.from_product([sorted(tickers), ["Adj Close", "Close"]])
+    rng = np.random.default_rng(len(tickers))
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (len(index), len(columns))), axis=0))
+    return pd.DataFrame(prices, index=index, columns=columns)
+
+
+class DownloadCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        masco._cached_prices.cache_clear()
+        self.addCleanup(masco._cached_prices.cache_clear)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        patcher = mock.patch.object(masco, "CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.download = mock.Mock(side_effect=fake_download)
+        patcher = mock.patch.object(masco.yf, "download", self.download)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_open_period_is_fetched_every_time(self):
+        end = (date.today() + timedelta(days=1)).isoformat()
+        first = masco._download_prices(("MAS",), "2025-01-01", end)
+        second = masco._download_prices(("MAS",), "2025-01-01", end)
+        self.assertEqual(self.download.call_count, 2)
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_missing_ticker_raises_and_is_not_cached(self):
+        def without_tyx(tickers, **kwargs):
+            data = fake_download(tickers, **kwargs)
+            data.loc[:, ("^TYX", slice(None))] = np.nan
+            return data
+
+        self.download.side_effect = without_tyx
+        with self.assertRaisesRegex(ValueError, r"\^TYX"):
+            masco._download_prices(("^GSPC", "^TYX"), "2010-01-01", "2010-06-01")
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+        # Once the ticker is available again, it is downloaded afresh
+        self.download.side_effect = fake_download
+        raw = masco._download_prices(("^GSPC", "^TYX"), "2010-01-01", "2010-06-01")
+        self.assertEqual(self.download.call_count, 2)
+        self.assertFalse(raw.isna().any().any())
+
+    def test_closed_period_is_served_from_disk(self):
+        raw = masco._download_prices(("^GSPC", "MAS"), "2010-01-01", "2010-06-01")
+        self.assertEqual([p.suffix for p in self.cache_dir.iterdir()], [".npz"])
+        self.assertEqual(list(raw.columns), ["^GSPC", "MAS"])
+
+        # A fresh process has an empty lru_cache; the .npz file must suffice
+        masco._cached_prices.cache_clear()
+        cached = masco._download_prices(("^GSPC", "MAS"), "2010-01-01", "2010-06-01")
+        self.assertEqual(self.download.call_count, 1)
+        pd.testing.assert_frame_equal(cached, raw, check_freq=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Regression results of masco_2025.run_regressions on a fixed dataset.
+
+The expected values were produced with statsmodels' OLS on the same data,
+which run_regressions replaced; they pin the numbers in the regression table.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import masco_2025 as masco
+
+
+def _synthetic_returns():
+    """60 months of deterministic returns with nearly collinear SP500 and VW."""
+    t = np.arange(60, dtype=np.float64)
+    sp = 0.04 * np.sin(0.7 * t)
+    vw = sp + 0.01 * np.cos(1.3 * t)
+    tyx = 0.2 * np.sin(0.31 * t + 1.0)
+    stock = 0.002 + 1.1 * sp - 0.3 * vw + 0.01 * tyx + 0.02 * np.sin(2.9 * t + 0.5)
+    return pd.DataFrame({"XYZ": stock, "SP500": sp, "VW": vw, "TYX": tyx})
+
+
+# Per model (in REGRESSION_MODELS order): params, bse, pvalues (const first),
+# then R², adjusted R² and F
+EXPECTED = [
+    (
+        [0.002182034687, 0.7979141169],
+        [0.001844553587, 0.06591910707],
+        [0.2416511146, 1.645045983e-17],
+        0.7164057643, 0.7115162085, 146.517556,
+    ),
+    (
+        [0.002118218419, 0.73960483],
+        [0.002075878285, 0.0726650853],
+        [0.3117780453, 1.606071093e-14],
+        0.6410828288, 0.6348946017, 103.5971724,
+    ),
+    (
+        [0.003482035936, 0.02040182182],
+        [0.00343758611, 0.02428611615],
+        [0.3153004249, 0.4043237595],
+        0.01202102429, -0.005013095985, 0.7057026776,
+    ),
+    (
+        [0.002248474193, 1.084651505, -0.2900198434],
+        [0.001841639308, 0.2653042546, 0.2599622386],
+        [0.2271468148, 0.0001377873796, 0.2692649109],
+        0.7224658186, 0.7127277771, 74.19005371,
+    ),
+    (
+        [0.00227621455, 1.087348989, -0.296215693, 0.01178718268],
+        [0.001844838174, 0.2657450887, 0.2604678809, 0.0130310616],
+        [0.2224200203, 0.0001386484001, 0.2602787913, 0.3695815247],
+        0.726462407, 0.7118086074, 49.57501983,
+    ),
+]
+
+
+class RunRegressionsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = masco.run_regressions(_synthetic_returns(), stock_ticker="XYZ")
+
+    def test_models_and_terms(self):
+        self.assertEqual(len(self.results), len(masco.REGRESSION_MODELS))
+        for result, regressors in zip(self.results, masco.REGRESSION_MODELS):
+            self.assertEqual(list(result.params.index), ["const", *regressors])
+            self.assertEqual(result.nobs, 60)
+            self.assertEqual(result.df_resid, 60 - 1 - len(regressors))
+
+    def test_matches_ols_reference(self):
+        for i, (result, expected) in enumerate(zip(self.results, EXPECTED)):
+            params, bse, pvalues, rsquared, rsquared_adj, fvalue = expected
+            with self.subTest(model=i + 1):
+                np.testing.assert_allclose(result.params.values, params, rtol=1e-8)
+                np.testing.assert_allclose(result.bse.values, bse, rtol=1e-8)
+                np.testing.assert_allclose(result.pvalues.values, pvalues, rtol=1e-7)
+                np.testing.assert_allclose(
+                    [result.rsquared, result.rsquared_adj, result.fvalue],
+                    [rsquared, rsquared_adj, fvalue],
+                    rtol=1e-8,
+                )
+
+    def test_table_rows(self):
+        table = masco.create_regression_table_dataframe(self.results, stock_ticker="XYZ")
+        self.assertEqual(list(table.columns), masco.REGRESSION_TABLE_COLUMNS)
+        self.assertEqual(
+            table.iloc[4].tolist(),
+            ["(5)", "0.0023 (0.0018)", "1.0873*** (0.2657)", "-0.2962 (0.2605)",
+             "0.0118 (0.0130)", f"{np.sqrt(self.results[4].mse_resid):.4f}, 0.7265"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()